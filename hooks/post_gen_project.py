@@ -1,64 +1,62 @@
 import asyncio
-from ast import literal_eval
+import os
 from pathlib import Path
-from subprocess import run
 
-from dotenv import load_dotenv
 from iterm2_api_wrapper import create_iterm_client
 
-from cookiecutter_pypackage.scripts import (
-    GitHubRepoConfig,
-    GitHubRepoDialog,
-    create_github_repository,
-)
+# Hooks run with the generated project as the working directory; only pay
+# for importing and parsing dotenv when that project actually has a .env.
+if (dotenv_path := Path.cwd() / ".env").is_file():
+    from dotenv import load_dotenv
+
+    load_dotenv(dotenv_path)
 
-load_dotenv()
 SUCCESS = "\x1b[1;32m"  # Green
 INFO = "\x1b[1;33m"  # Yellow
 ERROR = "\x1b[1;31m"  # Red
 TERMINATOR = "\x1b[0m"  # Reset color
 
-
-def run_command(command: str, cwd: str | Path | None = None) -> None:
-    """Run a shell command and print its output.
-
-    Args:
-        command: The shell command to run.
-        cwd: Working directory for the command.
-    """
-    process = run(command, capture_output=True, text=True, shell=True, cwd=cwd)
-    stdout, stderr = process.stdout, process.stderr
-
-    if process.returncode != 0:
-        print(f"Error running command: {command}")
-        print(stderr)
-    else:
-        if stdout.strip():
-            print(f"\n{stdout}")
+# Each init command gets this budget; the joined script gets the sum.
+COMMAND_TIMEOUT = 120
 
 
 async def run_hook() -> None:
-    debug: bool = literal_eval("{{cookiecutter.__debug}}")
-    project_dir = Path.cwd().parent.name / Path.cwd().relative_to(
-        "{{ cookiecutter.__project_dir }}"
-    )
+    debug: bool = "{{cookiecutter.__debug}}" == "True"
+    cwd = Path.cwd()
+    project_dir = cwd.parent.name / cwd.relative_to("{{ cookiecutter.__project_dir }}")
     print(f"{INFO}Project directory: {project_dir}{TERMINATOR}")
     # project_name = "{{ cookiecutter.pypi_package_name }}"
     cd_command = f"cd '{project_dir}'"
     gh_commands: list[str] = []
-    gh_username, gh_repo_name = ("{{ cookiecutter.__gh_slug }}").split("/")
-    gh_description = "{{ cookiecutter.project_short_description }}"
-    gh_dialog = GitHubRepoDialog(
-        project_dir=str(project_dir),
-        username=gh_username,
-        repo_name=gh_repo_name,
-        description=gh_description,
-        debug=debug,
-    )
     should_create_repo: bool = "{{cookiecutter.create_github_repo}}" == "yes"
 
     if should_create_repo:
-        result = gh_dialog.show()
+        # The dialog (Tk) and GitHub client are only needed here, so don't
+        # pay for importing them when no repository is requested.
+        from cookiecutter_pypackage.scripts.github.gh_script import (
+            create_github_repository,
+        )
+        from cookiecutter_pypackage.scripts.github.repo_dialog import (
+            GitHubRepoDialog,
+        )
+        from cookiecutter_pypackage.scripts.github.shared_types import (
+            GitHubRepoConfig,
+        )
+
+        gh_username, gh_repo_name = ("{{ cookiecutter.__gh_slug }}").split("/")
+        gh_description = "{{ cookiecutter.project_short_description }}"
+        gh_dialog = GitHubRepoDialog(
+            project_dir=str(project_dir),
+            username=gh_username,
+            repo_name=gh_repo_name,
+            description=gh_description,
+            debug=debug,
+        )
+        # GH_REPO_DIALOG=terminal asks on the command line instead of opening Tk
+        if os.environ.get("GH_REPO_DIALOG") == "terminal":
+            result = gh_dialog.prompt()
+        else:
+            result = gh_dialog.show()
 
         if result.cancelled:
             print(INFO + "GitHub repository creation cancelled by user." + TERMINATOR)
@@ -76,19 +74,22 @@ async def run_hook() -> None:
         "source .venv/bin/activate",
         *gh_commands,
     ]
-    # exit(0)
+    # The commands depend on each other (``cd`` and ``source`` only affect
+    # the current shell), so submit them as a single script in one session.
+    script = " && ".join(init_commands)
     async with create_iterm_client(new_tab=True) as client:
         state = await client.get_state_async()
-        for cmd in init_commands:
-            print(f">>> {INFO}{cmd}{TERMINATOR}")
-            try:
-                output = await state.run_command(cmd, timeout=120)
-                if output.strip():
-                    print(output)
-            except TimeoutError:
-                print(ERROR + f"Command timed out: {cmd}" + TERMINATOR)
-            except Exception as e:
-                print(ERROR + f"Command failed: {cmd}\nError: {e}" + TERMINATOR)
+        print(f">>> {INFO}{script}{TERMINATOR}")
+        try:
+            output = await state.run_command(
+                script, timeout=COMMAND_TIMEOUT * len(init_commands)
+            )
+            if output.strip():
+                print(output)
+        except TimeoutError:
+            print(ERROR + f"Command timed out: {script}" + TERMINATOR)
+        except Exception as e:
+            print(ERROR + f"Command failed: {script}\nError: {e}" + TERMINATOR)
 
 
 def main() -> None:
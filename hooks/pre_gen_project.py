@@ -1,21 +1,32 @@
 from __future__ import annotations
 
-import re
+import string
 import sys
 
 
-PACKAGE_NAME_REGEX = r"^[-a-zA-Z][-a-zA-Z0-9]+$"
+def is_valid_name(name: str, first: frozenset[str], rest: dict[int, None]) -> bool:
+    """Check *name* is at least two characters long, starts with a character
+    in *first*, and the remaining characters are all deleted by *rest*.
+    """
+    return len(name) > 1 and name[0] in first and not name[1:].translate(rest)
+
+
+# Equivalent to r"^[-a-zA-Z][-a-zA-Z0-9]+$"
+PACKAGE_NAME_FIRST = frozenset(string.ascii_letters + "-")
+PACKAGE_NAME_REST = str.maketrans("", "", string.ascii_letters + string.digits + "-")
 package_name = "{{ cookiecutter.pypi_package_name }}"
-if not re.match(PACKAGE_NAME_REGEX, package_name):
+if not is_valid_name(package_name, PACKAGE_NAME_FIRST, PACKAGE_NAME_REST):
     print(
         f"ERROR: The package name {package_name} is not a valid Python module name. Please do not use a _ and use - instead"
     )
     # Exit to cancel project
     sys.exit(1)
 
-PROJECT_SLUG_REGEX = r"^[_a-zA-Z][_a-zA-Z0-9]+$"
+# Equivalent to r"^[_a-zA-Z][_a-zA-Z0-9]+$"
+PROJECT_SLUG_FIRST = frozenset(string.ascii_letters + "_")
+PROJECT_SLUG_REST = str.maketrans("", "", string.ascii_letters + string.digits + "_")
 project_slug = "{{ cookiecutter.project_slug }}"
-if not re.match(PROJECT_SLUG_REGEX, project_slug):
+if not is_valid_name(project_slug, PROJECT_SLUG_FIRST, PROJECT_SLUG_REST):
     print(
         f"ERROR: The project slug {project_slug} is not a valid Python module name. Please do not use a - and use _ instead"
     )
@@ -13,83 +13,295 @@ Usage:
 The generated python-boilerplate/ directory will be created in the repo root.
 """
 
+import os
+import queue
 import shutil
 import sys
 import threading
 import time
 import traceback
+from collections import OrderedDict
+from collections.abc import Iterable
+from copy import deepcopy
 from pathlib import Path
+from typing import Any
 
+from cookiecutter.config import get_user_config
+from cookiecutter.generate import generate_context, generate_file, generate_files
 from cookiecutter.hooks import logger as cookiecutter_logger
-from cookiecutter.main import cookiecutter
+from cookiecutter.prompt import prompt_for_config
+from cookiecutter.utils import create_env_with_context, work_in
+from jinja2 import FileSystemLoader
 from rich.console import Console
-from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from rich.emoji import Emoji
+from rich.text import Text
+from watchdog.events import (
+    EVENT_TYPE_CLOSED,
+    EVENT_TYPE_CLOSED_NO_WRITE,
+    EVENT_TYPE_CREATED,
+    EVENT_TYPE_MODIFIED,
+    EVENT_TYPE_OPENED,
+    FileSystemEvent,
+    FileSystemEventHandler,
+)
 from watchdog.observers import Observer
 
 console = Console(emoji=True)
 ROOT = Path(__file__).parents[2]
 WATCH_PATH = ROOT / "{{cookiecutter.pypi_package_name}}"
 OUTPUT_PATH = ROOT / "python-boilerplate"
+CONTEXT_FILE = ROOT / "cookiecutter.json"
 REL_WATCH_PATH = ROOT.name / WATCH_PATH.relative_to(ROOT)
 REL_OUTPUT_PATH = ROOT.name / OUTPUT_PATH.relative_to(ROOT)
-STOP_EVENT = threading.Event()
+READ_EVENT_TYPES = frozenset({EVENT_TYPE_OPENED, EVENT_TYPE_CLOSED_NO_WRITE})
+WRITE_EVENT_TYPES = frozenset(
+    {EVENT_TYPE_MODIFIED, EVENT_TYPE_CREATED, EVENT_TYPE_CLOSED}
+)
+# Pre-styled pieces of the change notice; the path is added as plain text so
+# rich never parses it as markup.
+_CHANGE_PREFIX = Text.assemble(
+    Emoji.replace(":warning: "), ("Detected change in ", "yellow")
+)
+_CHANGE_SUFFIX = Text.assemble(".\n", ("Running cookiecutter...", "yellow"))
+_CWD = Path.cwd()
+_RUN_PY_SUFFIXES = ("/run.py", os.sep + "run.py")
+# One-way shutdown flag; a plain list cell avoids Event's lock on every check.
+_STOP = [False]
+# Old output trees are renamed to siblings with this prefix and deleted in the
+# background; the rename has to stay on the same filesystem to be atomic.
+_TRASH_PREFIX = f".{OUTPUT_PATH.name}.trash."
+# Distinct failures whose formatted tracebacks are kept; oldest is evicted.
+_MAX_TRACEBACKS = 8
+
+
+def _remove_trash() -> None:
+    """Delete old output trees left behind by an interrupted cleanup."""
+    for trash in ROOT.glob(f"{_TRASH_PREFIX}*"):
+        shutil.rmtree(trash, ignore_errors=True)
 
 
 class ChangeHandler(FileSystemEventHandler):
     def __init__(self) -> None:
-        self.stop_event: threading.Event = STOP_EVENT
-        self.last_run = 0.0
+        self._stop = _STOP
         self.debounce_period = 2  # seconds
+        # Events are queued here and coalesced by a single worker thread, so a
+        # burst of saves produces one rebuild once the tree has gone quiet.
+        self._queue: queue.SimpleQueue[FileSystemEvent | None] = queue.SimpleQueue()
+        self._worker = threading.Thread(
+            target=self._process_events, name="cookiecutter-rebuild", daemon=True
+        )
+        self._worker.start()
+        # Rendering context, reused until cookiecutter.json changes on disk
+        self._context: dict[str, Any] | None = None
+        self._context_mtime = 0
+        # Formatted tracebacks keyed by failure signature, and the signature
+        # of the most recent failure; both reset once a rebuild succeeds.
+        self._tracebacks: OrderedDict[tuple[Any, ...], str] = OrderedDict()
+        self._last_error: tuple[Any, ...] | None = None
+        # Make the template's Jinja2 extensions importable, as cookiecutter()
+        # does for the duration of each run.
+        if str(ROOT) not in sys.path:
+            sys.path.append(str(ROOT))
         # Disable hook logging to avoid exit messages
         cookiecutter_logger.disabled = True
 
     def on_any_event(self, event: FileSystemEvent) -> None:
-        # Ignore changes to run.py itself and directories
-        if Path(event.src_path).name == "run.py" or event.is_directory:
+        # Ignore changes to run.py itself, directories, and plain reads
+        # (rendering the template opens every file in it).
+        if (
+            event.event_type in READ_EVENT_TYPES
+            or event.is_directory
+            or os.fsdecode(event.src_path).endswith(_RUN_PY_SUFFIXES)
+        ):
             return
 
-        if self.stop_event.is_set():
+        if self._stop[0]:
             return
 
-        current_time = time.time()
-        if (current_time - self.last_run) > self.debounce_period:
-            self.last_run = current_time
-            console.print(
-                f":warning: [yellow]Detected change in[/yellow] "
-                f"[green]{str(Path(event.src_path).relative_to(Path.cwd()))}[/green].\n"
-                "[yellow]Running cookiecutter...[/yellow]"
-            )
+        self._queue.put_nowait(event)
+
+    def stop(self) -> None:
+        """Wake the worker so it can exit."""
+        self._queue.put_nowait(None)
+
+    def _process_events(self) -> None:
+        while (event := self._queue.get()) is not None:
+            # Trailing-edge debounce: keep absorbing events until none has
+            # arrived for a full debounce period, then rebuild once.
+            batch = [event]
             try:
-                # The output directory is in the repo root (matches cookiecutter.json pypi_package_name)
-                if OUTPUT_PATH.exists() and OUTPUT_PATH.is_dir():
-                    console.print(
-                        "[b]:warning:[/b] [yellow]Removing existing directory:[/yellow]\n"
-                        f"    [red]{OUTPUT_PATH}[/red]"
-                    )
-                    shutil.rmtree(OUTPUT_PATH)
-
-                # The template is the root directory, output to repo root
-                cookiecutter(
-                    str(ROOT),
-                    no_input=True,
-                    output_dir=str(ROOT),
+                while (
+                    event := self._queue.get(timeout=self.debounce_period)
+                ) is not None:
+                    batch.append(event)
+            except queue.Empty:
+                pass
+            else:
+                return
+            if self._stop[0]:
+                return
+            self._rebuild(batch)
+
+    def _rebuild(self, batch: list[FileSystemEvent]) -> None:
+        src_path = os.fsdecode(batch[-1].src_path)
+        console.print(
+            Text.assemble(
+                _CHANGE_PREFIX,
+                (os.path.relpath(src_path, _CWD), "green"),
+                _CHANGE_SUFFIX,
+            )
+        )
+        try:
+            # Edits to existing template files only need those files re-rendered;
+            # anything that removes or renames paths, or a new context, needs a
+            # full regeneration.
+            if (
+                not self._context_is_stale()
+                and OUTPUT_PATH.is_dir()
+                and all(e.event_type in WRITE_EVENT_TYPES for e in batch)
+            ):
+                changed = dict.fromkeys(os.fsdecode(e.src_path) for e in batch)
+                rendered = self._render_files(changed)
+                if self._stop[0]:
+                    return
+                console.print(
+                    f":white_check_mark: [green]Re-rendered {rendered} file(s).[/green]"
                 )
-                if self.stop_event.is_set():
+            else:
+                self._generate_all()
+                if self._stop[0]:
                     return
                 console.print(
                     ":white_check_mark: [green]Cookiecutter finished successfully.[/green]"
                 )
-            except Exception as e:
-                if isinstance(e, KeyboardInterrupt) or self.stop_event.is_set():
-                    return
-                console.print(f":x: [red]Error running cookiecutter[/red]:\n{e}")
-                traceback.print_exception(type(e), e, e.__traceback__, colorize=True)  # type: ignore
+            self._tracebacks.clear()
+            self._last_error = None
+        except Exception as e:
+            if isinstance(e, KeyboardInterrupt) or self._stop[0]:
+                return
+            console.print(f":x: [red]Error running cookiecutter[/red]:\n{e}")
+            self._report_traceback(e)
+
+        if not self._stop[0]:
+            console.print(":hourglass: [yellow]Waiting for next change...[/yellow]")
+
+    def _report_traceback(self, e: Exception) -> None:
+        """Print the traceback for *e*, formatting each distinct failure once.
 
-            if not self.stop_event.is_set():
-                console.print(":hourglass: [yellow]Waiting for next change...[/yellow]")
+        A template that stays broken across saves fails the same way on every
+        rebuild.  The failure is identified by its type, message and the code
+        location of every frame; an immediate repeat prints a one-line notice,
+        and a failure seen recently is reprinted from its cached text (the last
+        ``_MAX_TRACEBACKS`` distinct failures are kept).
+        """
+        signature = (
+            type(e),
+            str(e),
+            tuple(
+                (frame.f_code, lineno)
+                for frame, lineno in traceback.walk_tb(e.__traceback__)
+            ),
+        )
+        if signature == self._last_error:
+            console.print(
+                ":repeat: [yellow]Still failing with the same error "
+                "(traceback above).[/yellow]"
+            )
+            return
+        self._last_error = signature
+        text = self._tracebacks.get(signature)
+        if text is None:
+            text = "".join(traceback.format_exception(e, colorize=True))  # type: ignore
+            self._tracebacks[signature] = text
+            if len(self._tracebacks) > _MAX_TRACEBACKS:
+                self._tracebacks.popitem(last=False)
+        else:
+            self._tracebacks.move_to_end(signature)
+        sys.stderr.write(text)
+
+    def _generate_all(self) -> None:
+        # The output directory is in the repo root (matches cookiecutter.json pypi_package_name)
+        if OUTPUT_PATH.exists() and OUTPUT_PATH.is_dir():
+            console.print(
+                "[b]:warning:[/b] [yellow]Removing existing directory:[/yellow]\n"
+                f"    [red]{OUTPUT_PATH}[/red]"
+            )
+            # Move the old tree aside in one rename and delete it in the
+            # background while the new one is generated.
+            trash = OUTPUT_PATH.with_name(
+                f"{_TRASH_PREFIX}{os.getpid()}.{time.monotonic_ns()}"
+            )
+            OUTPUT_PATH.rename(trash)
+            threading.Thread(
+                target=shutil.rmtree,
+                args=(trash,),
+                kwargs={"ignore_errors": True},
+                name="cookiecutter-cleanup",
+                daemon=True,
+            ).start()
+
+        # The template is the root directory, output to repo root
+        generate_files(
+            repo_dir=str(ROOT),
+            context=self._render_context(),
+            output_dir=str(ROOT),
+        )
+
+    def _render_files(self, changed: Iterable[str]) -> int:
+        """Render only *changed* template files into the existing output tree."""
+        context = self._render_context()
+        env = create_env_with_context(context)
+        project_dir = str(ROOT / env.from_string(WATCH_PATH.name).render(**context))
+        rendered = 0
+        # Same layout generate_files uses: cwd and Jinja's loader at the template root
+        with work_in(WATCH_PATH):
+            env.loader = FileSystemLoader([".", "../templates"])
+            for src_path in changed:
+                if not os.path.isfile(src_path):
+                    continue
+                infile = os.path.relpath(src_path, WATCH_PATH)
+                outfile = env.from_string(infile).render(**context)
+                os.makedirs(
+                    os.path.join(project_dir, os.path.dirname(outfile)), exist_ok=True
+                )
+                generate_file(project_dir, infile, context, env)
+                rendered += 1
+        return rendered
+
+    def _context_is_stale(self) -> bool:
+        return (
+            self._context is None
+            or CONTEXT_FILE.stat().st_mtime_ns != self._context_mtime
+        )
+
+    def _render_context(self) -> dict[str, Any]:
+        """Return the ``--no-input`` context, rebuilding it only when
+        ``cookiecutter.json`` has changed since the last run.
+        """
+        if self._context_is_stale():
+            mtime = CONTEXT_FILE.stat().st_mtime_ns
+            config = get_user_config()
+            context = generate_context(
+                context_file=str(CONTEXT_FILE),
+                default_context=config["default_context"],
+            )
+            context["_cookiecutter"] = {
+                k: v
+                for k, v in context["cookiecutter"].items()
+                if not k.startswith("_")
+            }
+            context["cookiecutter"].update(prompt_for_config(context, no_input=True))
+            context["cookiecutter"]["_template"] = str(ROOT)
+            context["cookiecutter"]["_output_dir"] = str(ROOT)
+            context["cookiecutter"]["_repo_dir"] = str(ROOT)
+            context["cookiecutter"]["_checkout"] = None
+            self._context, self._context_mtime = context, mtime
+        # generate_files and the hooks get a copy so the cache stays pristine
+        return deepcopy(self._context)
 
 
 def main():
+    _remove_trash()
     # Watch the template directory where actual changes matter
     event_handler = ChangeHandler()
     observer = Observer()
@@ -110,12 +322,14 @@ def main():
         while True:
             time.sleep(1)
     except KeyboardInterrupt:
-        STOP_EVENT.set()
+        _STOP[0] = True
+        event_handler.stop()
         sys.stderr.write("\r  \r")  # Clear the ^C from console
         console.print(":stop_sign: [red]Stopping watcher...[/red]")
         observer.stop()
 
     observer.join(timeout=5)
+    _remove_trash()
     raise SystemExit(0)
 
 
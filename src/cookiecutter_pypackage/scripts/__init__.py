@@ -1,29 +1,53 @@
-# -- GitHub-specific -------------------------------------------------------
-from .github.gh_script import create_github_repository
-from .github.repo_dialog import GitHubFormResult, GitHubRepoDialog
-from .github.shared_types import GitHubRepoConfig, GitHubRepoConfigType
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # -- GitHub-specific ---------------------------------------------------
+    from .github.gh_script import create_github_repository
+    from .github.repo_dialog import GitHubFormResult, GitHubRepoDialog
+    from .github.shared_types import GitHubRepoConfig, GitHubRepoConfigType
+
+    # -- Reusable GUI core -------------------------------------------------
+    from .gui import (
+        CreateToolTip,
+        DialogBuilder,
+        FieldKind,
+        FieldSpec,
+        FormDialog,
+        FormResult,
+        FormSpec,
+        Severity,
+        ValidationIssue,
+        ValidationResult,
+        ask_directory,
+        bring_to_front_briefly,
+        center_window,
+        choices,
+        make_modal,
+        no_spaces_warning,
+        path_exists,
+        required,
+    )
+
+# Public names are imported on first access, so importing a submodule (e.g.
+# the Jinja2 extensions) does not pull in PyGithub or Tk.
+_LAZY: dict[str, str] = {
+    "create_github_repository": ".github.gh_script",
+    "GitHubRepoDialog": ".github.repo_dialog",
+    "GitHubFormResult": ".github.repo_dialog",
+    "GitHubRepoConfig": ".github.shared_types",
+    "GitHubRepoConfigType": ".github.shared_types",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name, ".gui" if name in __all__ else None)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-# -- Reusable GUI core -----------------------------------------------------
-from .gui import (
-    CreateToolTip,
-    DialogBuilder,
-    FieldKind,
-    FieldSpec,
-    FormDialog,
-    FormResult,
-    FormSpec,
-    Severity,
-    ValidationIssue,
-    ValidationResult,
-    ask_directory,
-    bring_to_front_briefly,
-    center_window,
-    choices,
-    make_modal,
-    no_spaces_warning,
-    path_exists,
-    required,
-)
 
 __all__ = [
     # GitHub
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import logging
 import os
-from enum import StrEnum
+import shlex
+from functools import cached_property
 from typing import Any, Literal, NamedTuple, Required, TypedDict, Unpack
 
 from github import (
@@ -19,6 +20,11 @@ from urllib3 import Retry
 from .shared_types import GitHubRepoConfigType
 
 GITHUB_AUTH = Auth.Token(os.getenv("GITHUB_TOKEN", ""))
+# Silence PyGithub's per-request logging once, rather than per client.
+logging.getLogger("github.Requester").disabled = True
+# Commands that never vary, rendered to shell strings once at import.
+GIT_ADD_COMMAND = shlex.join(("git", "add", "."))
+GIT_COMMIT_COMMAND = shlex.join(("git", "commit", "-m", "Initial commit"))
 type GitHubRequestValue = Literal["GET", "POST", "PATCH", "PUT", "DELETE"]
 
 
@@ -64,10 +70,9 @@ class RepositoryWrapper(Repository.Repository):
         self._set_attributes()
 
     def _set_attributes(self) -> None:
-        class RepoAttributes(StrEnum):
-            DEFAULT_BRANCH = self.repo_config.get("branch", "master")
-
-        self._default_branch = RepoAttributes.DEFAULT_BRANCH
+        self._default_branch = self._makeStringAttribute(
+            self.repo_config.get("branch", "master")
+        )
 
 
 class GithubWrapper(Github):
@@ -111,8 +116,6 @@ class GithubWrapper(Github):
         self.repo_config: GitHubRepoConfigType = repo_config
         self.lazy = lazy
         self.__repo: RepositoryWrapper | None = None
-        self.__user: AuthenticatedUser.AuthenticatedUser = self.get_user()
-        logging.getLogger("github.Requester").disabled = True
 
     @property
     def repo(self) -> RepositoryWrapper:
@@ -120,9 +123,9 @@ class GithubWrapper(Github):
             raise AttributeError("Repository not set. Try calling `set_repo` first.")
         return self.__repo
 
-    @property
+    @cached_property
     def user(self) -> AuthenticatedUser.AuthenticatedUser:
-        return self.__user
+        return self.get_user()
 
     @staticmethod
     def remove_unset_items(d: dict[str, Any]) -> dict[str, Any]:
@@ -184,8 +187,9 @@ def create_github_repository(
     github = GithubWrapper(repo_config=repo_config, auth=GITHUB_AUTH)
     branch = repo_config.get("branch", "master")
     commands = [
-        f"git init --initial-branch={branch}",
-        "git add . && git commit -m 'Initial commit'",
+        shlex.join(("git", "init", f"--initial-branch={branch}")),
+        GIT_ADD_COMMAND,
+        GIT_COMMIT_COMMAND,
     ]
     visibility = repo_config.get("visibility", "local")
     should_create_remote = visibility != "local"
@@ -205,8 +209,8 @@ def create_github_repository(
         )
         commands.extend(
             [
-                f'git remote add origin "{repo.clone_url}"',
-                f"git push -u origin {branch}",
+                shlex.join(("git", "remote", "add", "origin", repo.clone_url)),
+                shlex.join(("git", "push", "-u", "origin", branch)),
             ]
         )
 
@@ -19,19 +19,72 @@ Usage::
 from __future__ import annotations
 
 import os
+from collections.abc import Callable
 from dataclasses import fields as dc_fields
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from ..gui.builder import DialogBuilder
+from ..gui.font import TkFont
 from ..gui.result import FormResult as _GenericFormResult
-from ..gui.validation import choices, no_spaces_warning, path_exists
-from ..gui.window import ask_directory
+from ..gui.spec import FieldKind
+from ..gui.validation import Severity, choices, no_spaces_warning, path_exists
 from .shared_types import GitHubRepoConfig
 
+if TYPE_CHECKING:
+    from ..gui.dialog import FormDialog
+    from ..gui.spec import FieldSpec, FormSpec
+
+# Form constants that don't depend on the dialog's default values.
+_TEXT_FIELD_FONT = TkFont(
+    family="TkDefaultFont",
+    size=12,
+    weight="normal",
+    slant="roman",
+    underline=False,
+    overstrike=False,
+).value
+_VISIBILITY_OPTIONS = ("public", "private", "local")
+_VISIBILITY_CHOICES = choices(*_VISIBILITY_OPTIONS)
+_GH_FIELDS = frozenset(f.name for f in dc_fields(GitHubRepoConfig))
+
+
+_INPUT_KINDS = frozenset({FieldKind.TEXT, FieldKind.SELECT, FieldKind.CHECKBOX})
+
+
+def _initial_dir() -> str:
+    """Directory the user launched from; relative project paths hang off its parent."""
+    return os.path.realpath(os.environ.get("PWD") or os.getcwd())
+
+
+def _resolve_project_directory(values: dict[str, Any], initial_dir: str) -> None:
+    """Replace a relative ``project_directory`` with its absolute path, in place."""
+    relative_dir: str | None = values.get("project_directory")
+    if relative_dir:
+        values["project_directory"] = str(
+            (Path(initial_dir).parent / relative_dir).resolve()
+        )
+
+
+@cache
+def _tk_api() -> tuple[type[FormDialog], Callable[..., str | None]]:
+    """Import the Tk-backed dialog pieces on first use.
+
+    Kept out of module scope so that importing this module (e.g. for
+    :class:`GitHubFormResult`) doesn't load customtkinter / Tcl.
+    """
+    from ..gui.dialog import FormDialog
+    from ..gui.window import ask_directory
+
+    return FormDialog, ask_directory
+
 
 class GitHubFormResult(_GenericFormResult):
     """Extends :class:`FormResult` with a helper to produce a typed config."""
 
+    __slots__ = ()
+
     def to_config(self) -> GitHubRepoConfig:
         """Map collected values into a :class:`GitHubRepoConfig`.
 
@@ -39,9 +92,8 @@ class GitHubFormResult(_GenericFormResult):
         assigned; unknown keys are silently ignored.
         """
         config = GitHubRepoConfig()
-        valid_fields = {f.name for f in dc_fields(GitHubRepoConfig)}
         for key, value in self.values.items():
-            if key in valid_fields:
+            if key in _GH_FIELDS:
                 setattr(config, key, value)
         return config
 
@@ -52,6 +104,16 @@ class GitHubRepoDialog:
     Parameters correspond to default values pre-filled into the form.
     """
 
+    __slots__ = (
+        "_branch",
+        "_debug",
+        "_description",
+        "_project_dir",
+        "_repo_name",
+        "_username",
+        "_visibility",
+    )
+
     def __init__(
         self,
         *,
@@ -71,20 +133,61 @@ class GitHubRepoDialog:
         self._visibility = visibility
         self._debug = debug
 
+    def prompt(self) -> GitHubFormResult:
+        """Ask for the same values on the terminal instead of opening a window.
+
+        Skips Tcl/Tk start-up entirely, which is handy over SSH or when the
+        dialog would be slower than just typing the answers.  The questions,
+        defaults and validators come from the same :class:`FormSpec` the
+        window renders, and answers are normalised the way the window
+        collects them, so both return identical values: an error re-asks, a
+        warning is shown and accepted.  Ctrl+C / EOF cancels.
+        """
+        from rich.console import Console
+        from rich.prompt import Confirm, Prompt
+
+        console = Console()
+
+        def ask(spec: FieldSpec) -> Any:
+            if spec.kind == FieldKind.CHECKBOX:
+                label = spec.label or str(spec.key)
+                return Confirm.ask(label, default=bool(spec.default), console=console)
+            choices = list(spec.options) if spec.kind == FieldKind.SELECT else None
+            while True:
+                answer = Prompt.ask(
+                    spec.label or str(spec.key),
+                    default=spec.default or "",
+                    choices=choices,
+                    console=console,
+                )
+                # Same normalisation as FormDialog._collect_var_values
+                value = answer.strip() or None
+                for validator_fn in spec.validators:
+                    _, severity, msg, _ = validator_fn(value)
+                    if severity == Severity.ERROR:
+                        console.print(msg, style="red", markup=False)
+                        break
+                    if severity == Severity.WARNING:
+                        console.print(msg, style="yellow", markup=False)
+                else:
+                    return value
+
+        values: dict[str, Any] = {}
+        try:
+            for spec in self.form_spec().fields:
+                if spec.key is not None and spec.kind in _INPUT_KINDS:
+                    values[spec.key] = ask(spec)
+        except (KeyboardInterrupt, EOFError):
+            return GitHubFormResult(cancelled=True)
+        _resolve_project_directory(values, _initial_dir())
+        return GitHubFormResult(cancelled=False, values=values)
+
     def show(self) -> GitHubFormResult:
         """Display the dialog and return a :class:`GitHubFormResult`."""
-        from ..gui.dialog import FormDialog
-        from ..gui.font import TkFont
-
-        text_field_font = TkFont(
-            family="TkDefaultFont",
-            size=12,
-            weight="normal",
-            slant="roman",
-            underline=False,
-            overstrike=False,
-        ).value
-        initial_dir = os.getenv("PWD", os.getcwd())
+        FormDialog, ask_directory = _tk_api()
+
+        initial_dir = _initial_dir()
+        parent_dir = os.path.dirname(initial_dir)
 
         # We need a reference to the dialog so the Browse callback can
         # parent the file-picker correctly.  We achieve this by patching
@@ -101,15 +204,29 @@ class GitHubRepoDialog:
             )
             if new_dir is None:
                 print("Directory selection cancelled.")
-                return os.path.relpath(str(Path(initial_dir).parent), start=initial_dir)
-            full_path = Path(os.path.abspath(new_dir)).resolve()
-            relative_path = os.path.relpath(
-                full_path, start=str(Path(initial_dir).parent)
-            )
+                return os.path.relpath(parent_dir, start=initial_dir)
+            relative_path = os.path.relpath(os.path.realpath(new_dir), start=parent_dir)
             print(f"Selected directory: {new_dir} (relative path: {relative_path})")
             return relative_path
 
-        spec = (
+        dialog = FormDialog(self.form_spec(_browse), debug=self._debug)
+        dialog_ref = dialog  # patch the reference for _browse
+
+        generic_result = dialog.show()
+        _resolve_project_directory(generic_result.values, initial_dir)
+
+        # Wrap into GitHubFormResult
+        return GitHubFormResult(
+            cancelled=generic_result.cancelled,
+            values=generic_result.values,
+        )
+
+    def form_spec(self, browse: Callable[[], str] | None = None) -> FormSpec:
+        """Build the :class:`FormSpec` shared by :meth:`show` and :meth:`prompt`.
+
+        *browse* is the Browse… button callback; only the window needs it.
+        """
+        return (
             DialogBuilder("GitHub Repository Configuration", debug=self._debug)
             .min_size(520, 340)
             # -- row 0: project directory label (header) spanning full width
@@ -127,13 +244,13 @@ class GitHubRepoDialog:
                 row=1,
                 col=1,
                 validators=[path_exists],
-                font=text_field_font,
+                font=_TEXT_FIELD_FONT,
                 is_bound=True,  # Assist with layout and callback binding for the browse button
             )
             .add_button(
                 "browse",
                 help_text="Select the project directory.",
-                callback=_browse,
+                callback=browse,
                 bind_to="project_directory",
                 row=1,
                 col=2,
@@ -149,7 +266,7 @@ class GitHubRepoDialog:
                 ),
                 row=2,
                 col=1,
-                font=text_field_font,
+                font=_TEXT_FIELD_FONT,
             )
             # -- row 3: branch
             .add_text(
@@ -159,7 +276,7 @@ class GitHubRepoDialog:
                 help_text="Initial branch name for the repository.",
                 row=3,
                 col=1,
-                font=text_field_font,
+                font=_TEXT_FIELD_FONT,
             )
             # -- row 4: repo name
             .add_text(
@@ -170,7 +287,7 @@ class GitHubRepoDialog:
                 row=4,
                 col=1,
                 validators=[no_spaces_warning],
-                font=text_field_font,
+                font=_TEXT_FIELD_FONT,
             )
             # -- row 5: description
             .add_text(
@@ -180,7 +297,7 @@ class GitHubRepoDialog:
                 help_text="Short description of the repository.",
                 row=5,
                 col=1,
-                font=text_field_font,
+                font=_TEXT_FIELD_FONT,
             )
             # -- row 6: visibility
             .add_select(
@@ -188,33 +305,14 @@ class GitHubRepoDialog:
                 label="Visibility",
                 default=self._visibility,
                 help_text="public/private for remote, or local for no remote.",
-                options=["public", "private", "local"],
+                options=_VISIBILITY_OPTIONS,
                 readonly=True,
                 row=6,
                 col=1,
-                validators=[choices("public", "private", "local")],
-                font=text_field_font,
+                validators=[_VISIBILITY_CHOICES],
+                font=_TEXT_FIELD_FONT,
             )
-            # -- action buttons (row value doesn't matter — they go in the bar)
+            # -- action buttons (they go in the bar, ordered by row then col)
             .add_button("submit", help_text="Create the repository.", row=7, col=1)
             .add_button("cancel", help_text="Cancel without creating.", row=7, col=2)
         ).build()
-
-        dialog = FormDialog(spec, debug=self._debug)
-        dialog_ref = dialog  # patch the reference for _browse
-
-        generic_result = dialog.show()
-
-        # Resolve the relative display path with the absolute path
-        relative_dir: str = generic_result.values.get("project_directory", "")
-        if relative_dir:
-            generic_result.values["project_directory"] = str(
-                (Path(initial_dir).parent / relative_dir).resolve()
-            )
-
-        # Wrap into GitHubFormResult
-        gh_result = GitHubFormResult(
-            cancelled=generic_result.cancelled,
-            values=generic_result.values,
-        )
-        return gh_result
@@ -18,8 +18,8 @@ class GitHubRepoConfigType(TypedDict, total=False):
     visibility: Literal["public", "private", "local"]
 
 
-@dataclass
-class GitHubRepoConfig(dict):
+@dataclass(slots=True)
+class GitHubRepoConfig:
     """Canonical GitHub repository configuration.
 
     Field names here are the *single source of truth* for config keys
@@ -35,13 +35,11 @@ class GitHubRepoConfig(dict):
 
     def asdict(self) -> GitHubRepoConfigType:
         """Convert to a :class:`GitHubRepoConfigType` dict."""
-        return GitHubRepoConfigType(**self)
-
-    def __getitem__(self, key: str):
-        return getattr(self, key)
-
-    def __setitem__(self, key: str, value):
-        setattr(self, key, value)
-
-    def keys(self):
-        return self.__dataclass_fields__.keys()
+        return {
+            "name": self.name,
+            "project_directory": self.project_directory,
+            "username": self.username,
+            "branch": self.branch,
+            "description": self.description,
+            "visibility": self.visibility,
+        }
@@ -36,11 +36,12 @@ Window utilities
   :func:`ask_directory`
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .builder import DialogBuilder
-from .dialog import FormDialog
 from .result import FormResult
 from .spec import FieldKind, FieldSpec, FormSpec
-from .tooltip import CreateToolTip
 from .validation import (
     Severity,
     ValidationIssue,
@@ -50,7 +51,32 @@ from .validation import (
     path_exists,
     required,
 )
-from .window import ask_directory, bring_to_front_briefly, center_window, make_modal
+
+if TYPE_CHECKING:
+    from .dialog import FormDialog
+    from .tooltip import CreateToolTip
+    from .window import ask_directory, bring_to_front_briefly, center_window, make_modal
+
+# Names from the Tk-backed modules, imported on first access so that
+# building a FormSpec does not load tkinter/customtkinter.
+_LAZY_TK: dict[str, str] = {
+    "FormDialog": ".dialog",
+    "CreateToolTip": ".tooltip",
+    "center_window": ".window",
+    "bring_to_front_briefly": ".window",
+    "make_modal": ".window",
+    "ask_directory": ".window",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_TK.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Spec
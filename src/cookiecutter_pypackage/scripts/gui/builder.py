@@ -18,10 +18,20 @@ Example::
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import sys
+from collections.abc import Callable, Iterable
 
+from .font import DEFAULT_TK_FONT
 from .result import FormResult
-from .spec import FieldKind, FieldSpec, FormSpec, TkFont, TkFontDescription, ValidatorFn
+from .spec import FieldKind, FieldSpec, FormSpec, TkFontDescription, ValidatorFn
+
+# Equal option sequences share one tuple across every select field built.
+_OPTIONS_POOL: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
+def _pool_options(options: Iterable[str] | None) -> tuple[str, ...]:
+    key = tuple(options) if options else ()
+    return _OPTIONS_POOL.setdefault(key, key)
 
 
 class DialogBuilder:
@@ -30,6 +40,7 @@ class DialogBuilder:
     def __init__(self, title: str, debug: bool = False) -> None:
         self._title = title
         self._fields: list[FieldSpec] = []
+        self._append = self._fields.append
         self._min_width: int = 520
         self._min_height: int = 320
         self._debug = debug
@@ -54,9 +65,9 @@ class DialogBuilder:
         is_bound: bool = False,
     ) -> DialogBuilder:
         """Add a decorative label (no key / no result)."""
-        tk_font = font or TkFont().value
+        tk_font = font if font is not None else DEFAULT_TK_FONT
 
-        self._fields.append(
+        self._append(
             FieldSpec(
                 kind=FieldKind.LABEL,
                 label=text,
@@ -83,10 +94,10 @@ class DialogBuilder:
         is_bound: bool = False,
     ) -> DialogBuilder:
         """Add a text entry field."""
-        self._fields.append(
+        self._append(
             FieldSpec(
                 kind=FieldKind.TEXT,
-                key=key,
+                key=sys.intern(key),
                 label=label,
                 default=default,
                 help_text=help_text,
@@ -94,7 +105,7 @@ class DialogBuilder:
                 row=row,
                 col=col,
                 validators=validators or [],
-                font=font or TkFont().value,
+                font=font if font is not None else DEFAULT_TK_FONT,
                 is_bound=is_bound,
             )
         )
@@ -108,7 +119,7 @@ class DialogBuilder:
         default: str = "",
         help_text: str = "",
         callback: Callable[..., str] | None = None,
-        options: list[str] | None = None,
+        options: Iterable[str] | None = None,
         readonly: bool = False,
         row: int = 0,
         col: int = 0,
@@ -117,20 +128,20 @@ class DialogBuilder:
         is_bound: bool = False,
     ) -> DialogBuilder:
         """Add a combobox / select field."""
-        self._fields.append(
+        self._append(
             FieldSpec(
                 kind=FieldKind.SELECT,
-                key=key,
+                key=sys.intern(key),
                 label=label,
                 default=default,
                 help_text=help_text,
                 callback=callback,
-                options=options or [],
+                options=_pool_options(options),
                 readonly=readonly,
                 row=row,
                 col=col,
                 validators=validators or [],
-                font=font or TkFont().value,
+                font=font if font is not None else DEFAULT_TK_FONT,
                 is_bound=is_bound,
             )
         )
@@ -151,10 +162,10 @@ class DialogBuilder:
         is_bound: bool = False,
     ) -> DialogBuilder:
         """Add a checkbox field."""
-        self._fields.append(
+        self._append(
             FieldSpec(
                 kind=FieldKind.CHECKBOX,
-                key=key,
+                key=sys.intern(key),
                 label=label,
                 default=default,
                 help_text=help_text,
@@ -162,7 +173,7 @@ class DialogBuilder:
                 bind_to=bind_to,
                 row=row,
                 col=col,
-                font=font or TkFont().value,
+                font=font if font is not None else DEFAULT_TK_FONT,
                 is_bound=is_bound,
             )
         )
@@ -184,19 +195,20 @@ class DialogBuilder:
 
         Buttons with ``text`` equal to ``"Submit"`` or ``"Cancel"``
         (case-insensitive) automatically receive submit / cancel behaviour
-        when *callback* is ``None``.
+        when *callback* is ``None``.  Unbound buttons go in the action bar,
+        ordered left to right by ``(row, col)``.
         """
-        self._fields.append(
+        self._append(
             FieldSpec(
                 kind=FieldKind.BUTTON,
-                key=text.lower(),
+                key=sys.intern(text.lower()),
                 label=text.title(),
                 help_text=help_text,
                 callback=callback,
                 bind_to=bind_to,
                 row=row,
                 col=col,
-                font=font or TkFont().value,
+                font=font if font is not None else DEFAULT_TK_FONT,
                 is_bound=is_bound,
             )
         )
@@ -14,7 +14,9 @@ Usage::
 from __future__ import annotations
 
 import tkinter as tk
+from collections import defaultdict
 from collections.abc import Callable
+from functools import partial
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -24,16 +26,21 @@ from typing import (
     NamedTuple,
     Protocol,
     TypeGuard,
-    overload,
 )
 
 import customtkinter as ctk
 
 from ...run import console
+from .font import DEFAULT_TK_FONT, TkFont
 from .result import FormResult
-from .spec import FieldKind, FieldSpec, FormSpec, TkFont
+from .spec import FieldKind, FieldSpec, FormSpec
 from .tooltip import CreateToolTip
-from .validation import ValidationIssue, ValidationResult, ValidationStatus
+from .validation import (
+    Severity,
+    ValidationIssue,
+    ValidationResult,
+    ValidationStatus,
+)
 from .window import bring_to_front_briefly, center_window
 
 if TYPE_CHECKING:
@@ -197,6 +204,11 @@ class GridConfig(NamedTuple):
     grid_row: int
 
 
+# Lower-cased button labels that are auto-wired when no callback is given.
+_SUBMIT_LABELS = frozenset({"submit"})
+_CANCEL_LABELS = frozenset({"cancel"})
+
+
 # ---------------------------------------------------------------------------
 # FormDialog
 # ---------------------------------------------------------------------------
@@ -241,9 +253,6 @@ class FormDialog:
             if isinstance(e.widget, ctk.CTkEntry)
             else None
         ),
-        "focus": lambda e: (
-            e.widget.focus_set() if isinstance(e.widget, tk.Misc) else None
-        ),
         # "bring_to_front": lambda e: bring_to_front_briefly(e.widget.winfo_toplevel()),
         # "center_window": lambda e: center_window(e.widget.winfo_toplevel()),
         "undo": lambda e: e.widget.event_generate("<<Undo>>"),
@@ -289,6 +298,9 @@ class FormDialog:
 
         self._first_focus: CTkWidget | None = None
         self._traces: list[tuple[ctk.Variable, _TraceMode, str]] = []
+        # Tooltips whose variable changed since the last idle flush.
+        self._dirty_tooltips: dict[int, tuple[ctk.Variable, CreateToolTip]] = {}
+        self._tooltip_flush_id: str | None = None
 
     # -- public API --------------------------------------------------------
 
@@ -320,13 +332,10 @@ class FormDialog:
         self._root.bind("<Escape>", lambda _e: self._on_cancel())
         # Submit on Enter
         self._root.bind("<Return>", lambda _e: self._on_submit())
-        # Clicking anywhere focuses the clicked widget (for better keyboard navigation)
-        focus_modifier, focus_cb, _ = self.get_bind_info("focus")
-        self._root.bind_all(
-            focus_modifier,
-            focus_cb,
-            add="+",
-        )
+        # Clicking anywhere focuses the clicked widget (for better keyboard navigation).
+        # Bound as a Tcl script so clicks never round-trip through Python.
+        focus_modifier, _ = self.BIND_SEQUENCE_MAP["focus"]
+        self._root.tk.call("bind", "all", focus_modifier, "+focus %W")
 
         # _dialog points to the same window for rendering convenience
         self._dialog = self._root
@@ -390,17 +399,14 @@ class FormDialog:
         # self._content.columnconfigure(4, weight=0)
 
         # ── partition fields ─────────────────────────────────────────────
+        # FormSpec keeps its fields sorted by (row, col), so form fields
+        # render in grid order straight from the partition pass.
         form_fields: list[FieldSpec] = []
         action_buttons: list[FieldSpec] = []
 
         if self._reload and not self._debug:
             self._debug = True
 
-        # Filter out stale debug FieldSpecs injected by a previous reload
-        self._spec.fields[:] = [
-            f for f in self._spec.fields if not f.label.startswith("DEBUG:")
-        ]
-
         for f in self._spec.fields:
             if f.kind == FieldKind.BUTTON and not f.bind_to:
                 action_buttons.append(f)
@@ -410,7 +416,7 @@ class FormDialog:
         # ── render form fields into the flat grid ────────────────────────
         # Use spec.row * 2 as the grid row so there is always a free row
         # (spec.row * 2 + 1) available for inline validation errors.
-        for field_spec in sorted(form_fields, key=lambda f: (f.row, f.col)):
+        for field_spec in form_fields:
             self._render_field(field_spec)
 
         # ── separator + action-button bar ────────────────────────────────
@@ -449,8 +455,7 @@ class FormDialog:
                     padx = (2, 20)
                 btn.pack(side="left", fill="x", padx=padx, expand=True)
                 # Track for debug output
-                btn_key = btn_spec.label.lower().replace(" ", "_").replace(":", "")
-                self._button_widgets[btn_key] = btn
+                self._button_widgets[btn_spec.btn_key] = btn
 
         # ── debug buttons (below the action bar) ─────────────────────────
         if self._debug:
@@ -463,53 +468,56 @@ class FormDialog:
 
     def _render_field(self, spec: FieldSpec) -> None:
         """Render a single :class:`FieldSpec` into *parent*."""
-        renderer = _RENDERERS.get(spec.kind)
-        if renderer is None:
-            raise ValueError(f"Unsupported field kind: {spec.kind}")
+        try:
+            renderer = _RENDERERS[spec.kind]
+        except (IndexError, TypeError):
+            kind = getattr(spec.kind, "name", spec.kind)
+            raise ValueError(f"Unsupported field kind: {kind!r}") from None
 
         col, colspan, padx, pady, grid_row = 1, 1, (1, 1), (2, 2), spec.row * 2
-        if spec.kind in (FieldKind.TEXT, FieldKind.SELECT):
-            if not spec.label and not spec.is_bound:
-                # Standalone text field without a label or button
-                # - stretch across entire width
-                col, colspan, padx, pady = 0, 3, (7, 7), (2, 2)
-            elif not spec.label and spec.is_bound:
-                # No label but bound to a button (e.g. Browse…)
-                # — leave space for the button on the right
-                col, colspan, padx, pady = 0, 2, (1, 1), (2, 2)
-            elif spec.label and not spec.is_bound:
-                # Label on the left but no button on the right
-                # — stretch to the right edge
-                col, colspan, padx, pady = 1, 2, (1, 7), (2, 2)
-            else:  # spec.label and spec.is_bound
-                # Label on the left and button on the right
-                # — entry in the middle, stretching to fill space between
-                col, colspan, padx, pady = 1, 1, (1, 1), (2, 2)
-        elif spec.kind == FieldKind.LABEL:
-            # Labels always stretch full width
-            # — they are section headers, not field labels.
-            col, colspan, padx, pady = 0, 3, (7, 7), (8, 4)
-        elif spec.kind == FieldKind.CHECKBOX:
-            if spec.is_bound:
-                padx = (1, 1) if spec.label else (7, 1)
-            else:
-                padx = (1, 7) if spec.label else (7, 7)
-            # Checkboxes always sit in the label column on the left
-            col, colspan = (1, 2) if spec.label else (0, 2)
-        else:
-            # BUTTON fields
-            if spec.bind_to:
-                col, colspan = 2, 1
-                padx = (1, 7) if spec.label else (7, 7)
-                # Resolve the grid row of the field this button is bound to
-                grid_row = self._field_rows.get(spec.bind_to, grid_row)
-            else:
-                col, colspan, padx = 1, 2, (1, 7)
+        match spec.kind:
+            case FieldKind.TEXT | FieldKind.SELECT:
+                if not spec.label and not spec.is_bound:
+                    # Standalone text field without a label or button
+                    # - stretch across entire width
+                    col, colspan, padx, pady = 0, 3, (7, 7), (2, 2)
+                elif not spec.label and spec.is_bound:
+                    # No label but bound to a button (e.g. Browse…)
+                    # — leave space for the button on the right
+                    col, colspan, padx, pady = 0, 2, (1, 1), (2, 2)
+                elif spec.label and not spec.is_bound:
+                    # Label on the left but no button on the right
+                    # — stretch to the right edge
+                    col, colspan, padx, pady = 1, 2, (1, 7), (2, 2)
+                else:  # spec.label and spec.is_bound
+                    # Label on the left and button on the right
+                    # — entry in the middle, stretching to fill space between
+                    col, colspan, padx, pady = 1, 1, (1, 1), (2, 2)
+            case FieldKind.LABEL:
+                # Labels always stretch full width
+                # — they are section headers, not field labels.
+                col, colspan, padx, pady = 0, 3, (7, 7), (8, 4)
+            case FieldKind.CHECKBOX:
+                if spec.is_bound:
+                    padx = (1, 1) if spec.label else (7, 1)
+                else:
+                    padx = (1, 7) if spec.label else (7, 7)
+                # Checkboxes always sit in the label column on the left
+                col, colspan = (1, 2) if spec.label else (0, 2)
+            case _:
+                # BUTTON fields
+                if spec.bind_to:
+                    col, colspan = 2, 1
+                    padx = (1, 7) if spec.label else (7, 7)
+                    # Resolve the grid row of the field this button is bound to
+                    grid_row = self._field_rows.get(spec.bind_to, grid_row)
+                else:
+                    col, colspan, padx = 1, 2, (1, 7)
 
         renderer(self, spec, GridConfig(col, colspan, padx, pady, grid_row))
 
     def _render_label(self, spec: FieldSpec, grid_info: GridConfig) -> None:
-        font = spec.font if spec.font else TkFont().value
+        font = spec.font if spec.font else DEFAULT_TK_FONT
         lbl = ctk.CTkLabel(self._content, text=spec.label, font=font)
         lbl.grid(
             row=grid_info.grid_row,
@@ -566,7 +574,7 @@ class FormDialog:
         state = "readonly" if spec.readonly else "normal"
         combo = ctk.CTkComboBox(
             self._content,
-            values=spec.options,
+            values=list(spec.options),
             variable=var,
             state=state,
         )
@@ -607,6 +615,7 @@ class FormDialog:
         if spec.key:
             self._field_vars[spec.key] = var
             self._field_widgets[spec.key] = chk
+            self._field_rows[spec.key] = grid_info.grid_row
 
     def _render_button(self, spec: FieldSpec, grid_info: GridConfig) -> None:
         """Render an *auxiliary* button (e.g. Browse…) bound to a field.
@@ -641,8 +650,7 @@ class FormDialog:
             sticky=ctk.EW,
         )
         # Track for debug output
-        btn_key = spec.label.lower().replace(" ", "_").replace(":", "")
-        self._button_widgets[btn_key] = btn
+        self._button_widgets[spec.btn_key] = btn
 
     # -- callbacks ---------------------------------------------------------
 
@@ -654,9 +662,9 @@ class FormDialog:
 
         # Auto-wire Submit / Cancel by label
         label_lower = spec.label.strip().lower()
-        if label_lower == "submit":
+        if label_lower in _SUBMIT_LABELS:
             return self._on_submit
-        if label_lower == "cancel":
+        if label_lower in _CANCEL_LABELS:
             return self._on_cancel
         raise ValueError(
             f"Button '{spec.label}' has no callback and is not 'Submit' or 'Cancel'."
@@ -725,56 +733,22 @@ class FormDialog:
             values[key] = raw
         return values
 
-    @overload
-    def _trace[T](
-        self,
-        variable: ctk.Variable,
-        mode: _TraceMode,
-        *,
-        obj: T,
-        attr: str,
-    ) -> str: ...
-    @overload
-    def _trace[T](
-        self, variable: ctk.Variable, mode: _TraceMode, *, callback: Callable[..., T]
-    ) -> str: ...
     def _trace[T](
-        self,
-        variable: ctk.Variable,
-        mode: _TraceMode,
-        *,
-        obj: Any | None = None,
-        attr: str | None = None,
-        callback: Callable[..., T] | None = None,
+        self, variable: ctk.Variable, mode: _TraceMode, callback: Callable[..., T]
     ) -> str:
         """Register a Tk variable trace and track it for cleanup.
 
-        Either supply *obj* + *attr* (sets ``obj.attr = variable.get()``
-        on every trace event) **or** a raw *callback*.
-
         Returns the trace-id string so the caller can remove it
         individually if needed.
         """
-        if callback is not None:
-            cb = callback
-        elif obj is not None and attr is not None:
-            if not hasattr(obj, attr):
-                raise AttributeError(f"{obj!r} has no attribute '{attr}'")
-
-            def _(*_args) -> T:
-                setattr(obj, attr, variable.get())
-                return obj
-
-            cb = _
-        else:
-            raise ValueError("_trace requires either (obj + attr) or callback.")
-
-        trace_id: str = variable.trace_add(mode, cb)
+        trace_id: str = variable.trace_add(mode, callback)
         self._traces.append((variable, mode, trace_id))
         return trace_id
 
     def _remove_all_traces(self) -> None:
-        """Remove every registered trace — call before destroying Tk."""
+        """Remove every registered trace and any pending tooltip flush — call
+        before destroying Tk.
+        """
         for variable, mode, trace_id in self._traces:
             try:
                 variable.trace_remove(mode, trace_id)
@@ -782,9 +756,39 @@ class FormDialog:
                 pass  # already gone
         self._traces.clear()
 
+        if self._tooltip_flush_id is not None and self._root is not None:
+            self._root.after_cancel(self._tooltip_flush_id)
+        self._tooltip_flush_id = None
+        self._dirty_tooltips.clear()
+
+    def _schedule_tooltip_update(
+        self, variable: ctk.Variable, tooltip: CreateToolTip, *_args: Any
+    ) -> None:
+        """Queue *tooltip* to mirror *variable* on the next idle cycle.
+
+        Fast typing then costs one tooltip update per idle pass rather than
+        one per keystroke, which matters when a debug tooltip re-queries
+        grid info on every assignment.
+        """
+        self._dirty_tooltips[id(tooltip)] = (variable, tooltip)
+        if self._tooltip_flush_id is None and self._root is not None:
+            self._tooltip_flush_id = self._root.after_idle(self._flush_tooltips)
+
+    def _flush_tooltips(self) -> None:
+        """Copy each queued variable's value onto its tooltip text."""
+        self._tooltip_flush_id = None
+        dirty, self._dirty_tooltips = self._dirty_tooltips, {}
+        for variable, tooltip in dirty.values():
+            tooltip.text = variable.get()
+
     def _get_lowest_available_row(self) -> int:
-        """Calculate the lowest available grid row index for debug buttons."""
-        return (max(f.row for f in self._spec.fields) + 1) * 2
+        """Calculate the lowest available grid row index for debug buttons.
+
+        ``FormSpec.fields`` is an immutable tuple sorted by row at
+        construction, so the last field holds the highest one.
+        """
+        fields = self._spec.fields
+        return (fields[-1].row + 1) * 2 if fields else 0
 
     def _attach_tooltips(self) -> None:
         """Walk all widgets and attach debug tooltips in one pass.
@@ -800,9 +804,8 @@ class FormDialog:
         for spec in self._spec.fields:
             if spec.key and spec.key in self._field_widgets:
                 widget_to_spec[id(self._field_widgets[spec.key])] = spec
-            btn_key = spec.label.lower().replace(" ", "_").replace(":", "")
-            if btn_key in self._button_widgets:
-                widget_to_spec[id(self._button_widgets[btn_key])] = spec
+            if spec.btn_key in self._button_widgets:
+                widget_to_spec[id(self._button_widgets[spec.btn_key])] = spec
 
         debug_cb = self._debug_tooltip if self._debug else None
 
@@ -846,8 +849,11 @@ class FormDialog:
 
             # Wire trace so the tooltip stays in sync with field value
             if spec and spec.key and spec.key in self._field_vars:
+                var = self._field_vars[spec.key]
                 self._trace(
-                    self._field_vars[spec.key], "write", obj=tooltip, attr="text"
+                    var,
+                    "write",
+                    callback=partial(self._schedule_tooltip_update, var, tooltip),
                 )
 
             # Only recurse for unknown widget types — CTk leaf widgets'
@@ -879,6 +885,9 @@ class FormDialog:
                         severity=severity,
                     )
                 )
+                # One error per field: later validators would only repeat it.
+                if severity == Severity.ERROR:
+                    break
         return vr
 
     def _display_errors(self, vr: ValidationResult) -> None:
@@ -892,7 +901,7 @@ class FormDialog:
             parent = widget.master
             # In the flat grid, fields sit at grid_row (= spec.row * 2).
             # The slot immediately below (grid_row + 1) is reserved for errors.
-            grid_row = widget.grid_info().get("row", 0)
+            grid_row = self._field_rows.get(issue.field_key, 0)
             tkfont = TkFont(weight="bold", size=12, underline=True)
             err_lbl = ctk.CTkLabel(
                 parent,
@@ -1018,7 +1027,7 @@ class FormDialog:
 
         values = self._collect_var_values()
 
-        for spec in sorted(self._spec.fields, key=lambda f: (f.row, f.col)):
+        for spec in self._spec.fields:
             key = spec.key or spec.label or "—"
             value = str(values.get(spec.key, "—")) if spec.key else "—"
             # Look up keyed field widgets first, then button widgets by label
@@ -1026,8 +1035,7 @@ class FormDialog:
             if spec.key:
                 widget = self._field_widgets.get(spec.key)
             if widget is None and spec.kind == FieldKind.BUTTON:
-                btn_key = spec.label.lower().replace(" ", "_").replace(":", "")
-                widget = self._button_widgets.get(btn_key)
+                widget = self._button_widgets.get(spec.btn_key)
             widget_class = type(widget).__name__ if widget else "—"
             widget_info = ""
             if self._is_gridded(widget):
@@ -1057,7 +1065,7 @@ class FormDialog:
 
             tbl.add_row(
                 key,
-                spec.kind.value,
+                spec.kind.name.lower(),
                 spec.label,
                 value,
                 str(spec.default) if spec.default is not None else "—",
@@ -1082,13 +1090,13 @@ class FormDialog:
         var_tbl.add_column("Raw .get()", style="green")
         var_tbl.add_column("Trace IDs", style="dim", no_wrap=True)
 
-        trace_map: dict[str, list[str]] = {}
+        # _traces holds the same Variable objects as _field_vars, so key by id.
+        trace_map: defaultdict[int, list[str]] = defaultdict(list)
         for variable, mode, trace_id in self._traces:
-            var_str = str(variable)
-            trace_map.setdefault(var_str, []).append(f"{mode}:{trace_id[:12]}")
+            trace_map[id(variable)].append(f"{mode}:{trace_id[:12]}")
 
         for key, var in self._field_vars.items():
-            traces = trace_map.get(str(var), [])
+            traces = trace_map.get(id(var), [])
             var_tbl.add_row(
                 key,
                 type(var).__name__,
@@ -1257,10 +1265,15 @@ class FormDialog:
 # Renderer dispatch table
 # ---------------------------------------------------------------------------
 
-_RENDERERS: dict[FieldKind, Callable[[FormDialog, FieldSpec, GridConfig], None]] = {
-    FieldKind.LABEL: FormDialog._render_label,
-    FieldKind.TEXT: FormDialog._render_text,
-    FieldKind.SELECT: FormDialog._render_select,
-    FieldKind.CHECKBOX: FormDialog._render_checkbox,
-    FieldKind.BUTTON: FormDialog._render_button,
-}
+# Indexed by FieldKind value, so dispatch is a single tuple subscript.
+_RENDERERS: tuple[Callable[[FormDialog, FieldSpec, GridConfig], None], ...] = (
+    FormDialog._render_text,  # FieldKind.TEXT
+    FormDialog._render_select,  # FieldKind.SELECT
+    FormDialog._render_checkbox,  # FieldKind.CHECKBOX
+    FormDialog._render_button,  # FieldKind.BUTTON
+    FormDialog._render_label,  # FieldKind.LABEL
+)
+if len(_RENDERERS) != len(FieldKind):
+    raise RuntimeError(
+        f"_RENDERERS has {len(_RENDERERS)} entries for {len(FieldKind)} field kinds"
+    )
@@ -282,3 +282,8 @@ class TkFont(TkFontBase):
 
     def items(self):
         return self.__dataclass_fields__.items()
+
+
+# Shared default ``TkFont().value``; the tuple is immutable, so every field
+# without an explicit font can reference the same object.
+DEFAULT_TK_FONT: TkFontDescription = TkFont().value
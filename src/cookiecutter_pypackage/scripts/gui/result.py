@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class FormResult:
     """Result returned by :meth:`FormDialog.show`.
 
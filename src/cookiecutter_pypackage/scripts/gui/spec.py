@@ -6,26 +6,33 @@ Build a ``FormSpec`` either directly (declarative) or via
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
-from .font import TkFont, TkFontDescription
-from .validation import ValidationReport
-from enum import StrEnum, auto
+from enum import IntEnum
+from operator import attrgetter
 from typing import Any
 
+from .font import DEFAULT_TK_FONT, TkFontDescription
+from .validation import ValidationReport
+
 # ---------------------------------------------------------------------------
 # Field kinds
 # ---------------------------------------------------------------------------
 
 
-class FieldKind(StrEnum):
-    """Discriminator for :class:`FieldSpec`."""
+class FieldKind(IntEnum):
+    """Discriminator for :class:`FieldSpec`.
 
-    TEXT = auto()
-    SELECT = auto()
-    CHECKBOX = auto()
-    BUTTON = auto()
-    LABEL = auto()
+    Small dense integers so renderer dispatch hashes and compares as ints.
+    Values are not stable identifiers: compare against members, and use
+    ``kind.name`` (e.g. ``"TEXT"``) when a string is needed.
+    """
+
+    TEXT = 0
+    SELECT = 1
+    CHECKBOX = 2
+    BUTTON = 3
+    LABEL = 4
 
 
 # ---------------------------------------------------------------------------
@@ -41,6 +48,8 @@ message string if invalid, or ``None`` if valid."""
 # FieldSpec
 # ---------------------------------------------------------------------------
 
+_BTN_KEY_TABLE = str.maketrans({" ": "_", ":": None})
+
 
 @dataclass(frozen=True, slots=True)
 class FieldSpec:
@@ -53,7 +62,7 @@ class FieldSpec:
         label: Display text shown next to the widget.
         default: Default value (type depends on *kind*).
         help_text: Tooltip text shown on hover.
-        options: For ``SELECT`` fields — the list of valid choices.
+        options: For ``SELECT`` fields — the valid choices.
         readonly: For ``SELECT`` fields — whether the combobox is read-only.
         callback: For ``BUTTON`` fields — the function to call when clicked.  Receives the
             current form values as a dict and returns a value to assign to the field specified by
@@ -65,6 +74,10 @@ class FieldSpec:
         validators: Optional list of :data:`ValidatorFn` callables.
         font: Optional ``(family, size, weight, slant, underline, overstrike)`` tuple for ``LABEL`` fields.
         is_bound: Whether the field is bound to a value in the form state dict. Used for layout and callback binding.
+
+    Attributes:
+        btn_key: *label* normalised into the dialog's button-widget key,
+            computed once at construction.
     """
 
     kind: FieldKind
@@ -72,15 +85,24 @@ class FieldSpec:
     label: str = ""
     default: Any = None
     help_text: str = ""
-    options: list[str] = field(default_factory=list)
+    options: tuple[str, ...] = ()
     readonly: bool = False
     callback: Callable[..., str] | None = None
     bind_to: str | None = None
     row: int = 0
     col: int = 0
     validators: list[ValidatorFn] = field(default_factory=list)
-    font: TkFontDescription = field(default_factory=lambda: TkFont().value)
+    font: TkFontDescription = DEFAULT_TK_FONT
     is_bound: bool = field(default=False)
+    btn_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "btn_key", self.label.lower().translate(_BTN_KEY_TABLE)
+        )
+
+
+_BY_POSITION = attrgetter("row", "col")
 
 
 # ---------------------------------------------------------------------------
@@ -94,12 +116,18 @@ class FormSpec:
 
     Parameters:
         title: Window title.
-        fields: Ordered list of :class:`FieldSpec` instances.
+        fields: The :class:`FieldSpec` instances.  Any sequence is accepted;
+            it is stored as a new tuple sorted by ``(row, col)``, so the
+            caller's list is left untouched and the order cannot drift.
+            Action-bar buttons are laid out in this order too.
         min_width: Minimum dialog width in pixels.
         min_height: Minimum dialog height in pixels.
     """
 
     title: str
-    fields: list[FieldSpec] = field(default_factory=list)
+    fields: Sequence[FieldSpec] = ()
     min_width: int = 520
     min_height: int = 320
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "fields", tuple(sorted(self.fields, key=_BY_POSITION)))
@@ -3,6 +3,12 @@ from typing import Callable
 
 import customtkinter as ctk
 
+_TIP_OFFSET_X = 10  # px right of the widget's left edge
+_TIP_OFFSET_Y = 8  # px below the widget's bottom edge
+_TIP_AUTO_HIDE_MS = 10000  # 10 seconds
+# Attribute on the owning toplevel that holds its shared tooltip window.
+_TIP_ATTR = "_tooltip_window"
+
 
 class CreateToolTip:
     """
@@ -47,23 +53,29 @@ class CreateToolTip:
     def show_tip(self):
         if self.tip_window or not self.text:
             return
-        x = self.widget.winfo_rootx() + 10
-        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 8
+        # One Tcl round trip for the three geometry queries.
+        w = str(self.widget)
+        rootx, rooty, height = map(
+            int,
+            self.widget.tk.splitlist(
+                self.widget.tk.eval(
+                    f"list [winfo rootx {w}] [winfo rooty {w}] [winfo height {w}]"
+                )
+            ),
+        )
+        x = rootx + _TIP_OFFSET_X
+        y = rooty + height + _TIP_OFFSET_Y
 
-        # Create tooltip window
-        self.tip_window = tk.Toplevel(self.widget)
-        self.tip_window.wm_overrideredirect(True)  # removes window decorations
+        self.tip_window, label = self._shared_window()
+        label.configure(text=self.text)
         self.tip_window.wm_geometry(f"+{x}+{y}")
-        self.tip_window.attributes("-topmost", True)
-        self.tip_window.transient(self.widget.winfo_toplevel())
-
-        label = ctk.CTkLabel(self.tip_window, text=self.text)
-        label.pack(ipadx=1)
+        self.tip_window.deiconify()
+        self.tip_window.lift()
 
         self.tip_window.update_idletasks()
 
-        # auto-hide after 10 seconds
-        self._auto_hide_id = self.tip_window.after(10000, self.hide_tip)
+        # auto-hide after a while
+        self._auto_hide_id = self.tip_window.after(_TIP_AUTO_HIDE_MS, self.hide_tip)
 
     def hide_tip(self, event: tk.Event | None = None):
         if self._auto_hide_id is not None:
@@ -71,7 +83,31 @@ class CreateToolTip:
             self._auto_hide_id = None
         if self.tip_window:
             try:
-                self.tip_window.destroy()
+                self.tip_window.withdraw()
             except tk.TclError:
                 pass
             self.tip_window = None
+
+    def _shared_window(self) -> tuple[tk.Toplevel, ctk.CTkLabel]:
+        """Return this widget's toplevel tooltip window, creating it if needed.
+
+        The window is stored on the toplevel itself, so it lives and dies
+        with the dialog that owns it. Hovering withdraws and re-shows it
+        instead of building a new Toplevel each time.
+        """
+        owner = self.widget.winfo_toplevel()
+        cached = getattr(owner, _TIP_ATTR, None)
+        if cached is not None and cached[0].winfo_exists():
+            return cached
+
+        tip_window = tk.Toplevel(owner)
+        tip_window.withdraw()
+        tip_window.wm_overrideredirect(True)  # removes window decorations
+        tip_window.attributes("-topmost", True)
+        tip_window.transient(owner)
+
+        label = ctk.CTkLabel(tip_window, text="")
+        label.pack(ipadx=1)
+
+        setattr(owner, _TIP_ATTR, (tip_window, label))
+        return tip_window, label
@@ -0,0 +1,51 @@
+from cookiecutter_pypackage.scripts.gui.spec import FieldKind, FieldSpec, FormSpec
+
+
+def _field(key, row, col=0, kind=FieldKind.TEXT):
+    return FieldSpec(kind=kind, key=key, row=row, col=col)
+
+
+def test_fields_sorted_by_row_then_col():
+    fields = [_field("c", 2), _field("b", 1, 1), _field("a", 1, 0), _field("z", 0)]
+
+    spec = FormSpec(title="t", fields=fields)
+
+    assert isinstance(spec.fields, tuple)
+    assert [f.key for f in spec.fields] == ["z", "a", "b", "c"]
+
+
+def test_callers_list_is_left_untouched():
+    fields = [_field("b", 1), _field("a", 0)]
+
+    spec = FormSpec(title="t", fields=fields)
+    fields.append(_field("late", 0))
+
+    assert [f.key for f in fields] == ["b", "a", "late"]
+    assert [f.key for f in spec.fields] == ["a", "b"]
+
+
+def test_sort_is_stable_for_equal_positions():
+    # Action-bar buttons share a row and column; declaration order is kept.
+    buttons = [
+        FieldSpec(kind=FieldKind.BUTTON, label=label, row=5)
+        for label in ("Submit", "Cancel", "Help")
+    ]
+
+    spec = FormSpec(title="t", fields=[*buttons, _field("x", 0)])
+
+    assert [f.label for f in spec.fields[1:]] == ["Submit", "Cancel", "Help"]
+
+
+def test_builder_output_is_sorted():
+    from cookiecutter_pypackage.scripts.gui.builder import DialogBuilder
+
+    builder = (
+        DialogBuilder("t")
+        .add_text("second", label="Second", row=1)
+        .add_text("first", label="First", row=0)
+    )
+
+    spec = builder.build()
+
+    assert [f.key for f in spec.fields] == ["first", "second"]
+    assert [f.key for f in builder._fields] == ["second", "first"]
@@ -0,0 +1,86 @@
+import ast
+import re
+from pathlib import Path
+
+import pytest
+
+HOOK = Path(__file__).parents[1] / "hooks" / "pre_gen_project.py"
+
+# The regexes the hook used before switching to is_valid_name.
+PACKAGE_NAME_REGEX = r"^[-a-zA-Z][-a-zA-Z0-9]+$"
+PROJECT_SLUG_REGEX = r"^[_a-zA-Z][_a-zA-Z0-9]+$"
+
+
+def _load_hook_names():
+    """Execute the hook's helper and character tables without its checks.
+
+    The hook exits at import time because its names are unrendered Jinja
+    placeholders, so only the function and the *_FIRST/*_REST tables run.
+    """
+    tree = ast.parse(HOOK.read_text())
+    keep = [
+        node
+        for node in tree.body
+        if isinstance(node, (ast.Import, ast.ImportFrom, ast.FunctionDef))
+        or (
+            isinstance(node, ast.Assign)
+            and node.targets[0].id.endswith(("_FIRST", "_REST"))
+        )
+    ]
+    namespace = {}
+    exec(compile(ast.Module(keep, type_ignores=[]), str(HOOK), "exec"), namespace)
+    return namespace
+
+
+hook = _load_hook_names()
+
+NAMES = [
+    "",
+    "a",
+    "-",
+    "_",
+    "ab",
+    "Ab",
+    "a1",
+    "1ab",
+    "9",
+    "-ab",
+    "_ab",
+    "ab-",
+    "ab_",
+    "my-package",
+    "my_package",
+    "my-package-",
+    "my_package_",
+    "my package",
+    "my.package",
+    "café",
+    "naïve-pkg",
+    "ünïcode",
+    "ab١",  # Arabic-Indic digit one: str.isdigit() but not [0-9]
+    "ab\t",
+    "--",
+    "__",
+]
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_package_name_matches_old_regex(name):
+    expected = re.match(PACKAGE_NAME_REGEX, name) is not None
+    assert (
+        hook["is_valid_name"](
+            name, hook["PACKAGE_NAME_FIRST"], hook["PACKAGE_NAME_REST"]
+        )
+        is expected
+    )
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_project_slug_matches_old_regex(name):
+    expected = re.match(PROJECT_SLUG_REGEX, name) is not None
+    assert (
+        hook["is_valid_name"](
+            name, hook["PROJECT_SLUG_FIRST"], hook["PROJECT_SLUG_REST"]
+        )
+        is expected
+    )
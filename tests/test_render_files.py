@@ -0,0 +1,80 @@
+import json
+from pathlib import Path
+
+import pytest
+from cookiecutter.main import cookiecutter
+
+from cookiecutter_pypackage import run
+
+TEMPLATE_DIR = "{{cookiecutter.pypi_package_name}}"
+FILES = {
+    "README.md": "# {{ cookiecutter.project_slug }}\n",
+    "src/{{cookiecutter.project_slug}}/__init__.py": '__version__ = "{{ cookiecutter.version }}"\n',
+}
+
+
+@pytest.fixture
+def template(tmp_path, monkeypatch):
+    root = tmp_path / "template"
+    (root / TEMPLATE_DIR).mkdir(parents=True)
+    (root / "cookiecutter.json").write_text(
+        json.dumps(
+            {
+                "project_slug": "demo",
+                "pypi_package_name": "demo-pkg",
+                "version": "0.1.0",
+            }
+        )
+    )
+    for rel, body in FILES.items():
+        path = root / TEMPLATE_DIR / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(body)
+
+    config = tmp_path / "config.yaml"
+    config.write_text(f"replay_dir: {tmp_path / 'replay'}\n")
+    monkeypatch.setenv("COOKIECUTTER_CONFIG", str(config))
+    monkeypatch.setattr(run, "ROOT", root)
+    monkeypatch.setattr(run, "WATCH_PATH", root / TEMPLATE_DIR)
+    monkeypatch.setattr(run, "CONTEXT_FILE", root / "cookiecutter.json")
+    return root
+
+
+@pytest.fixture
+def handler():
+    handler = run.ChangeHandler()
+    yield handler
+    handler.stop()
+
+
+def _tree(path):
+    return {
+        str(p.relative_to(path)): p.read_text()
+        for p in sorted(path.rglob("*"))
+        if p.is_file()
+    }
+
+
+def test_render_files_matches_full_generation(template, handler, tmp_path):
+    sources = [str(template / TEMPLATE_DIR / rel) for rel in FILES]
+
+    assert handler._render_files(sources) == len(FILES)
+
+    reference = cookiecutter(
+        str(template), no_input=True, output_dir=str(tmp_path / "reference")
+    )
+    assert _tree(template / "demo-pkg") == _tree(Path(reference))
+
+
+def test_render_files_only_touches_changed_files(template, handler):
+    readme, init = (template / TEMPLATE_DIR / rel for rel in FILES)
+    handler._render_files([str(readme), str(init)])
+    out_init = template / "demo-pkg" / "src" / "demo" / "__init__.py"
+    out_init.write_text("untouched\n")
+
+    readme.write_text("# {{ cookiecutter.project_slug }} edited\n")
+    rendered = handler._render_files([str(readme), str(template / "gone.txt")])
+
+    assert rendered == 1
+    assert (template / "demo-pkg" / "README.md").read_text() == "# demo edited\n"
+    assert out_init.read_text() == "untouched\n"
@@ -0,0 +1,83 @@
+import io
+
+import pytest
+
+from cookiecutter_pypackage.scripts.github.repo_dialog import (
+    GitHubRepoDialog,
+    _resolve_project_directory,
+)
+from cookiecutter_pypackage.scripts.gui.spec import FieldKind
+
+PROJECT_DIR = "cookiecutter-pypackage/python-boilerplate"
+
+
+class _Var:
+    """Stand-in for a Tk variable holding a field's default value."""
+
+    def __init__(self, value):
+        self._value = value
+
+    def get(self):
+        return self._value
+
+
+@pytest.fixture
+def hook_cwd(tmp_path, monkeypatch):
+    """Run from inside the generated project, as post_gen_project does."""
+    project = tmp_path / PROJECT_DIR
+    project.mkdir(parents=True)
+    monkeypatch.chdir(project)
+    monkeypatch.setenv("PWD", str(project))
+    return project
+
+
+def _dialog():
+    return GitHubRepoDialog(
+        project_dir=PROJECT_DIR,
+        username="octocat",
+        repo_name="python-boilerplate",
+        description="A great project",
+    )
+
+
+def _gui_default_values(dialog, initial_dir):
+    """Values the window would return if every default were submitted."""
+    from cookiecutter_pypackage.scripts.gui.dialog import FormDialog
+
+    spec = dialog.form_spec()
+    form = FormDialog(spec)
+    form._field_vars = {
+        f.key: _Var(f.default)
+        for f in spec.fields
+        if f.key and f.kind in (FieldKind.TEXT, FieldKind.SELECT)
+    }
+    values = form._collect_var_values()
+    assert not form._validate(values).has_errors
+    _resolve_project_directory(values, str(initial_dir))
+    return values
+
+
+def test_prompt_accepts_every_default_like_the_gui(hook_cwd, monkeypatch):
+    dialog = _dialog()
+    monkeypatch.setattr("sys.stdin", io.StringIO("\n" * 20))
+
+    result = dialog.prompt()
+
+    assert not result.cancelled
+    assert result.values == _gui_default_values(dialog, hook_cwd)
+
+
+def test_prompt_reasks_on_missing_directory(hook_cwd, monkeypatch):
+    answers = ["/does/not/exist", ""] + [""] * 10
+    monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(answers) + "\n"))
+
+    result = _dialog().prompt()
+
+    assert not result.cancelled
+    assert result.values["directory"] == PROJECT_DIR
+
+
+def test_prompt_eof_cancels(hook_cwd, monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO(""))
+
+    assert _dialog().prompt().cancelled